@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+''' An easy way to make Qt GUIs using the argparse standard module
+
+	Importing this package does not import Qt. The GUI classes below are
+	loaded on first access, so CLI-only users of typeHelpers and
+	groupingTools avoid the qtpy import cost entirely.
+'''
+
+_GUI_NAMES = ('ArgDialog', 'ArgparseListWidget', 'ArgGroupWidget')
+
+def __getattr__(name):
+	if name in _GUI_NAMES:
+		from . import gui
+		return getattr(gui, name)
+
+	raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -2,38 +2,100 @@
 ''' Utility functions for organizing arguments by their groups '''
 
 import argparse
+import weakref
+
+_ORPHAN_TITLES = frozenset(('positional arguments', 'optional arguments', 'options'))
+_HelpAction = argparse._HelpAction
+
+# weak keys so cached structures neither outlive their parser nor get
+# picked up by a new parser allocated at a recycled address
+_organizeCache = weakref.WeakKeyDictionary()
+_structureCache = weakref.WeakKeyDictionary()
+
+def iterGroups(parser):
+	''' Yields (groupName, description, [actions]) tuples, one per argparse group
+
+		groupName is None for arguments that do not belong to a group
+	'''
+	for group in parser._action_groups:
+		groupName = None if group.title in _ORPHAN_TITLES else group.title
+		yield (groupName, group.description, [action for action in group._group_actions if action.__class__ is not _HelpAction])
 
 def organizeIntoGroups(parser):
-	''' Returns a dict where keys are argparse groups and values are dicts of name/argument pairs '''
+	''' Returns a dict where keys are argparse groups and values are dicts of name/argument pairs
+
+		Results are cached per parser and rebuilt if arguments are added to the parser
+	'''
+	signature = len(parser._actions)
+
+	cached = _organizeCache.get(parser)
+	if cached is not None and cached[0] == signature:
+		return cached[1]
+
 	groups = {}
 
 	for group in parser._action_groups:
 		groups[group] = {}
 
 		for action in group._group_actions:
-			if type(action) != argparse._HelpAction:
+			if action.__class__ is not _HelpAction:
 				groups[group][action.dest] = action
 
+	_organizeCache[parser] = (signature, groups)
+
 	return groups
 
-def parseIntoGroups(parser):
+def _groupStructure(parser):
+	''' Returns a list of (groupName, [(dest, action), ...]) tuples
+
+		groupName is None for arguments that do not belong to a group
+
+		Results are cached per parser and rebuilt if arguments are added to the parser
+	'''
+	signature = len(parser._actions)
+
+	cached = _structureCache.get(parser)
+	if cached is not None and cached[0] == signature:
+		return cached[1]
+
+	structure = []
+
+	for group in parser._action_groups:
+		if group.title in _ORPHAN_TITLES:
+			groupName = None
+		else:
+			groupName = group.title
+
+		actions = []
+		for action in group._group_actions:
+			if action.__class__ is not _HelpAction:
+				actions.append((action.dest, action))
+
+		structure.append((groupName, actions))
+
+	_structureCache[parser] = (signature, structure)
+
+	return structure
+
+def parseIntoGroups(parser, namespace=None):
 	''' Returns a dict where keys are argparse group names and values are dicts of name/value pairs
 
 		Arguments that do not belong to a group will be stored in the top-level dict
+
+		Pass an already-parsed namespace to organize its values without re-running
+		parser.parse_args() (and its type converters)
 	'''
-	args = vars(parser.parse_args())
+	args = vars(namespace) if namespace is not None else vars(parser.parse_args())
 	groups = {}
 
-	for group in parser._action_groups:
-		if group.title in ['positional arguments', 'optional arguments', 'options']:
+	for groupName, actions in _groupStructure(parser):
+		if groupName is None:
 			groupDict = groups
 		else:
-			groupName = group.title
 			groupDict = {}
 			groups[groupName] = groupDict
 
-		for action in group._group_actions:
-			if type(action) != argparse._HelpAction:
-				groupDict[action.dest] = args[action.dest]
+		for dest, action in actions:
+			groupDict[dest] = args[dest]
 
 	return groups
@@ -53,7 +53,7 @@ class ArgparseListWidget(QtWidgets.QWidget):
 		super().__init__(parent)
 
 		self.argParser = argParser
-		self.groupedParser = groupingTools.organizeIntoGroups(self.argParser)
+		self._groupWidgets = {}
 		self.setLayout(QtWidgets.QHBoxLayout())
 
 		self.groupList = QtWidgets.QListWidget(self)
@@ -65,18 +65,16 @@ class ArgparseListWidget(QtWidgets.QWidget):
 
 		self.orphanGroupname = orphanGroupName
 
-		for group,arguments in self.groupedParser.items():
-			if group.title in ['positional arguments', 'optional arguments', 'options']:
-				groupName = self.orphanGroupname
+		for groupName, description, arguments in groupingTools.iterGroups(self.argParser):
+			if groupName is None:
 				if self.widgetStack.count() > 0:
 					groupWidget = self.widgetStack.widget(0)
 				else:
-					groupWidget = self._addGroup(groupName, self.argParser.description)
+					groupWidget = self._addGroup(self.orphanGroupname, self.argParser.description)
 			else:
-				groupName = group.title
-				groupWidget = self._addGroup(groupName, group.description)
+				groupWidget = self._addGroup(groupName, description)
 
-			groupWidget.addArguments(arguments.values())
+			groupWidget.addArguments(arguments)
 
 		self.groupList.setCurrentRow(0)
 		self.groupList.currentRowChanged.connect(self.widgetStack.setCurrentIndex)
@@ -88,25 +86,24 @@ class ArgparseListWidget(QtWidgets.QWidget):
 		groupWidget = ArgGroupWidget(name, description=description)
 		groupWidget.valueAdjusted.connect(self.valueAdjusted.emit)
 		self.widgetStack.addWidget(groupWidget)
+		self._groupWidgets[name] = groupWidget
 
 		return groupWidget
 
 	def setValues(self, values):
-		for i in range(self.widgetStack.count()):
-			groupName = self.groupList.item(i).text()
+		for groupName, groupWidget in self._groupWidgets.items():
 			if groupName in values:
-				self.widgetStack.widget(i).setValues(values[groupName])
+				groupWidget.setValues(values[groupName])
 			else:
-				self.widgetStack.widget(i).setValues(values)
+				groupWidget.setValues(values)
 
 	def getValues(self):
 		settings = {}
-		for i in range(self.widgetStack.count()):
-			groupName = self.groupList.item(i).text()
+		for groupName, groupWidget in self._groupWidgets.items():
 			if groupName == self.orphanGroupname:
-				settings = {**settings, **self.widgetStack.widget(i).getValues()}
+				settings = {**settings, **groupWidget.getValues()}
 			else:
-				settings[groupName] = self.widgetStack.widget(i).getValues()
+				settings[groupName] = groupWidget.getValues()
 
 		return settings
 
@@ -121,12 +118,14 @@ class ArgGroupWidget(QtWidgets.QWidget):
 	def __init__(self, name, arguments=[], description=None, parent=None):
 		super().__init__(parent)
 		self.name = name
+		self._widgetsByDest = {}
 
 		self.setLayout(QtWidgets.QVBoxLayout())
 		self.layout().setAlignment(QtCore.Qt.AlignTop)
 		self.form = QtWidgets.QWidget()
 		self.form.setLayout(QtWidgets.QFormLayout())
-		self.form.layout().setHorizontalSpacing(32)
+		self._formLayout = self.form.layout()
+		self._formLayout.setHorizontalSpacing(32)
 
 		if description is None:
 			text = QtWidgets.QLabel(f'<h1>{name}</h1>')
@@ -151,21 +150,14 @@ class ArgGroupWidget(QtWidgets.QWidget):
 			widget.setToolTip(helpText)
 			widget.setWhatsThis(helpText)
 
-			self.form.layout().addRow(argument.dest, widget)
+			self._formLayout.addRow(argument.dest, widget)
+			self._widgetsByDest[argument.dest] = widget
 
 	def setValues(self, values):
-		for row in range(self.form.layout().rowCount()):
-			itemName = self.form.layout().itemAt(row, QtWidgets.QFormLayout.LabelRole).widget().text()
-			if itemName in values:
-				widget = self.form.layout().itemAt(row, QtWidgets.QFormLayout.FieldRole).widget()
-				widget.setValue(values[itemName])
+		for itemName, value in values.items():
+			widget = self._widgetsByDest.get(itemName)
+			if widget is not None:
+				widget.setValue(value)
 
 	def getValues(self):
-		values = {}
-		for row in range(self.form.layout().rowCount()):
-			itemName = self.form.layout().itemAt(row, QtWidgets.QFormLayout.LabelRole).widget().text()
-			itemValue = self.form.layout().itemAt(row, QtWidgets.QFormLayout.FieldRole).widget().value()
-
-			values[itemName] = itemValue
-
-		return values
+		return {itemName: widget.value() for itemName, widget in self._widgetsByDest.items()}
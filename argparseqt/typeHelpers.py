@@ -8,15 +8,19 @@ def rgb(val):
 		raise argparse.ArgumentTypeError('Expected 6 characters but received "%s"' % val)
 
 	try:
-		return tuple(int(val[i:i+2], 16) for i in (0, 2, 4))
-	except:
+		packed = int(val, 16)
+	except ValueError:
 		raise argparse.ArgumentTypeError('Invalid hex string: %s' % val)
 
+	return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
 def rgba(val):
 	if len(val) != 8:
 		raise argparse.ArgumentTypeError('Expected 8 characters but received "%s"' % val)
 
 	try:
-		return tuple(int(val[i:i+2], 16) for i in (0, 2, 4, 6))
-	except:
+		packed = int(val, 16)
+	except ValueError:
 		raise argparse.ArgumentTypeError('Invalid hex string: %s' % val)
+
+	return ((packed >> 24) & 0xFF, (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
@@ -2,9 +2,11 @@
 ''' Widgets with a universal api for getting/setting convenience '''
 
 import sys
+import time
 import pathlib
 import argparse
 import typing
+import functools
 
 try:
 	import serial.tools.list_ports
@@ -15,6 +17,71 @@ from qtpy import QtCore, QtGui, QtWidgets
 
 from . import typeHelpers
 
+_SP_PREFERRED_FIXED = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+_SP_FIXED_MINEXPANDING = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.MinimumExpanding)
+
+def _flatHBox(parent):
+	''' Installs a spacing- and margin-free QHBoxLayout on parent and returns it '''
+	lay = QtWidgets.QHBoxLayout(parent)
+	lay.setSpacing(0)
+	lay.setContentsMargins(0, 0, 0, 0)
+
+	return lay
+
+_glyphIconCache = {}
+
+def _glyphIcon(glyph):
+	''' Renders a text glyph into a small QIcon, shared across widgets (cached per glyph) '''
+	icon = _glyphIconCache.get(glyph)
+	if icon is None:
+		pixmap = QtGui.QPixmap(16, 16)
+		pixmap.fill(QtCore.Qt.transparent)
+		painter = QtGui.QPainter(pixmap)
+		# draw with the theme's button-text color, like setText() would
+		painter.setPen(QtWidgets.QApplication.palette().color(QtGui.QPalette.ButtonText))
+		painter.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, glyph)
+		painter.end()
+		icon = QtGui.QIcon(pixmap)
+		_glyphIconCache[glyph] = icon
+
+	return icon
+
+@functools.lru_cache(maxsize=256)
+def _swatchIcon(size, rgba):
+	''' Returns a solid-color square QIcon, shared across widgets (cached per size/color) '''
+	pixmap = QtGui.QPixmap(size, size)
+	pixmap.fill(QtGui.QColor(*rgba))
+
+	return QtGui.QIcon(pixmap)
+
+_ACTION_FACTORIES = {
+	argparse._StoreConstAction: lambda argument, parent: ComboBox([argument.const], [argument.const], parent),
+	argparse._StoreTrueAction: lambda argument, parent: BoolSelector(parent=parent),
+	argparse._StoreFalseAction: lambda argument, parent: BoolSelector(parent=parent),
+}
+
+_TYPE_FACTORIES = {
+	int: lambda parent: SpinBox(parent=parent),
+	float: lambda parent: DoubleSpinBox(parent=parent),
+	bool: lambda parent: BoolSelector(parent=parent),
+	typeHelpers.rgb: lambda parent: ColorWidget(hasAlpha=False, parent=parent),
+	typeHelpers.rgba: lambda parent: ColorWidget(hasAlpha=True, parent=parent),
+	pathlib.Path: lambda parent: FileChooser(parent),
+	list: lambda parent: ListWidget(list, parent),
+}
+
+if 'serial' in sys.modules:
+	_TYPE_FACTORIES[typeHelpers.Serial] = lambda parent: SerialPortChooser(parent)
+
+def _isListType(dataType):
+	''' True for list or a parameterized list generic
+
+		Plain classes are exactly `type`, while generics (including list[int],
+		which passes isinstance(..., type) on older interpreters) are not, so
+		the typing machinery is only consulted for the latter
+	'''
+	return dataType is list or (type(dataType) is not type and typing.get_origin(dataType) is list)
+
 def makeWidget(argumentOrType, parent=None, defaultValue=None, choices=None, helpText=None):
 	''' Creates and returns a data type-appropriate wrapped-widget
 
@@ -32,41 +99,23 @@ def makeWidget(argumentOrType, parent=None, defaultValue=None, choices=None, hel
 		if helpText is None and argument.help is not None:
 			helpText = argument.help
 
-		if type(argument) == argparse._StoreConstAction:
-			widget = ComboBox([argument.const], [argument.const], parent)
-
-		elif type(argument) in [argparse._StoreTrueAction, argparse._StoreFalseAction]:
-			widget = BoolSelector(parent=parent)
+		actionFactory = _ACTION_FACTORIES.get(argument.__class__)
+		if actionFactory is not None:
+			widget = actionFactory(argument, parent)
 
 	else:
 		dataType = argumentOrType
 
 	if widget is None:
+		typeFactory = _TYPE_FACTORIES.get(dataType)
+
 		if choices is not None:
 			widget = ComboBox(choices, parent=parent)
 
-		elif dataType == int:
-			widget = SpinBox(parent=parent)
-
-		elif dataType == float:
-			widget = DoubleSpinBox(parent=parent)
-
-		elif dataType == bool:
-			widget = BoolSelector(parent=parent)
-
-		elif dataType == typeHelpers.rgb:
-			widget = ColorWidget(hasAlpha=False, parent=parent)
-
-		elif dataType == typeHelpers.rgba:
-			widget = ColorWidget(hasAlpha=True, parent=parent)
+		elif typeFactory is not None:
+			widget = typeFactory(parent)
 
-		elif dataType == pathlib.Path:
-			widget = FileChooser(parent)
-
-		elif 'serial' in sys.modules and dataType == typeHelpers.Serial:
-			widget = SerialPortChooser(parent)
-
-		elif dataType == list or typing.get_origin(dataType) == list:
+		elif _isListType(dataType):
 			widget = ListWidget(dataType, parent)
 
 		else:
@@ -90,30 +139,35 @@ class ResetableWidget(QtWidgets.QWidget):
 		self.widget = widget
 		self.defaultValue = defaultValue
 		self.nullable = not isinstance(widget, QtWidgets.QComboBox)
-		self.nulled = True
+		# starts False so the first setValue(None) still clears the inner
+		# widget's display before the None short-circuit can kick in
+		self.nulled = False
+		self._resetBuilt = False
 
-		self.setSizePolicy(
-			QtWidgets.QSizePolicy.Preferred,
-			QtWidgets.QSizePolicy.Fixed,
-		)
+		self.setSizePolicy(_SP_PREFERRED_FIXED)
+		widget.setParent(self)
 
-		resetButton = QtWidgets.QToolButton(self)
-		resetButton.setSizePolicy(
-			QtWidgets.QSizePolicy.Fixed,
-			QtWidgets.QSizePolicy.MinimumExpanding,
-		)
-		resetButton.pressed.connect(self.reset)
-		resetButton.setText('↶')
+		self._aliasWidgetApi(widget)
 
-		if defaultValue is None:
-			resetButton.setToolTip('Clear')
-		else:
-			resetButton.setToolTip('Set default: ' + str(defaultValue))
+	def _aliasWidgetApi(self, widget):
+		''' Exposes the inner widget's change signal as self.valueChanged and fills in clearValue
 
-		self.setLayout(QtWidgets.QHBoxLayout())
-		self.layout().setContentsMargins(0, 0, 0, 0)
-		self.layout().addWidget(widget)
-		self.layout().addWidget(resetButton)
+			Known widget types dispatch through _SIGNAL_ATTR/_CLEAR_ALIAS; unknown
+			subclasses fall back to hasattr probing
+		'''
+		cls = type(widget)
+		signalName = _SIGNAL_ATTR.get(cls)
+
+		if signalName is not None:
+			signal = getattr(widget, signalName)
+			signal.connect(self.clearNull)
+			self.valueChanged = signal
+
+			clearName = _CLEAR_ALIAS.get(cls)
+			if clearName is not None:
+				widget.clearValue = getattr(widget, clearName)
+
+			return
 
 		if hasattr(widget, 'valueChanged'):
 			widget.valueChanged.connect(self.clearNull)
@@ -127,6 +181,37 @@ class ResetableWidget(QtWidgets.QWidget):
 		if not hasattr(widget, 'clearValue') and hasattr(widget, 'clear'):
 			widget.clearValue = widget.clear
 
+	def showEvent(self, event):
+		if not self._resetBuilt:
+			self._buildResetUI()
+
+		super().showEvent(event)
+
+	def _buildResetUI(self):
+		''' Builds the layout and reset control on first show, so never-shown dialogs skip the cost '''
+		self._resetBuilt = True
+
+		if self.defaultValue is None:
+			resetTip = 'Clear'
+		else:
+			resetTip = 'Set default: ' + str(self.defaultValue)
+
+		self._lay = _flatHBox(self)
+		self._lay.addWidget(self.widget)
+
+		if isinstance(self.widget, QtWidgets.QLineEdit):
+			# a trailing action on the line edit avoids a separate QToolButton per row
+			resetAction = self.widget.addAction(_glyphIcon('↶'), QtWidgets.QLineEdit.TrailingPosition)
+			resetAction.setToolTip(resetTip)
+			resetAction.triggered.connect(self.reset, QtCore.Qt.DirectConnection)
+		else:
+			resetButton = QtWidgets.QToolButton(self)
+			resetButton.setSizePolicy(_SP_FIXED_MINEXPANDING)
+			resetButton.pressed.connect(self.reset, QtCore.Qt.DirectConnection)
+			resetButton.setIcon(_glyphIcon('↶'))
+			resetButton.setToolTip(resetTip)
+			self._lay.addWidget(resetButton)
+
 	def clearNull(self):
 		self.nulled = False
 
@@ -138,9 +223,16 @@ class ResetableWidget(QtWidgets.QWidget):
 
 	def setValue(self, value):
 		if self.nullable and value is None:
+			if self.nulled:
+				return
 			self.widget.clearValue()
 			self.nulled = True
 		else:
+			try:
+				if not self.nulled and self.widget.value() == value:
+					return
+			except Exception:
+				pass
 			self.widget.setValue(value)
 			self.nulled = False
 
@@ -151,29 +243,35 @@ class ResetableWidget(QtWidgets.QWidget):
 		self.setValue(None)
 
 class ListWidgetItem(QtWidgets.QWidget):
-	def __init__(self, widget, parent=None):
+	def __init__(self, widget, parent=None, removeCallback=None):
 		super().__init__(parent)
 		self.widget = widget
+		self._removeCallback = removeCallback
 
 		self.abandonButton = QtWidgets.QToolButton(self)
-		self.abandonButton.setText('🗑️')
-		self.abandonButton.pressed.connect(self.abandon)
-		self.abandonButton.setSizePolicy(
-			QtWidgets.QSizePolicy.Fixed,
-			QtWidgets.QSizePolicy.MinimumExpanding,
-		)
+		self.abandonButton.setIcon(_glyphIcon('🗑️'))
+		self.abandonButton.pressed.connect(self.abandon, QtCore.Qt.DirectConnection)
+		self.abandonButton.setSizePolicy(_SP_FIXED_MINEXPANDING)
 
-		self.setLayout(QtWidgets.QHBoxLayout())
-		self.layout().setContentsMargins(0, 0, 0, 0)
-
-		self.layout().addWidget(self.abandonButton)
-		self.layout().addWidget(self.widget)
+		self._lay = _flatHBox(self)
+		self._lay.addWidget(self.abandonButton)
+		self._lay.addWidget(self.widget)
 
 		patches = ['value', 'setValue', 'clearValue', 'valueChanged']
 		for prop in patches:
 			setattr(self, prop, getattr(self.widget, prop))
 
 	def abandon(self):
+		# disconnect before tearing down so the parent list is not re-scanned
+		# by a spurious valueChanged during widget destruction
+		try:
+			self.valueChanged.disconnect()
+		except (TypeError, RuntimeError):
+			pass
+
+		if self._removeCallback is not None:
+			self._removeCallback(self)
+
 		parentLayout = self.parentWidget().layout()
 		idx = parentLayout.indexOf(self)
 		parentLayout.takeAt(idx)
@@ -186,6 +284,7 @@ class ListWidget(QtWidgets.QWidget):
 		super().__init__(parent)
 
 		self.dataType = dataType
+		self._children = []
 		self.subDataType = typing.get_args(self.dataType)
 		if len(self.subDataType) == 0:
 			self.subDataType = str
@@ -198,8 +297,10 @@ class ListWidget(QtWidgets.QWidget):
 		self.childrenContainer.layout().setContentsMargins(0, 0, 0, 0)
 
 		self.addItemButton = QtWidgets.QToolButton(self)
-		self.addItemButton.setText('➕ Add item')
-		self.addItemButton.clicked.connect(self._addKid)
+		self.addItemButton.setIcon(_glyphIcon('➕'))
+		self.addItemButton.setText('Add item')
+		self.addItemButton.setToolButtonStyle(QtCore.Qt.ToolButtonTextBesideIcon)
+		self.addItemButton.clicked.connect(self._addKid, QtCore.Qt.DirectConnection)
 
 		self.setLayout(QtWidgets.QVBoxLayout())
 		self.layout().setSpacing(0)
@@ -207,11 +308,13 @@ class ListWidget(QtWidgets.QWidget):
 		self.layout().addWidget(self.childrenContainer)
 		self.layout().addWidget(self.addItemButton)
 
-	def _addKid(self, v=None):
-		listWidgetItem = ListWidgetItem(makeWidget(self.subDataType, self.childrenContainer), self.childrenContainer)
-		listWidgetItem.valueChanged.connect(self.onChildValueChanged)
+	def _addKid(self, v=None, connectSignal=True):
+		listWidgetItem = ListWidgetItem(makeWidget(self.subDataType, self.childrenContainer), self.childrenContainer, self._children.remove)
+		if connectSignal:
+			listWidgetItem.valueChanged.connect(self.onChildValueChanged)
 
 		self.childrenContainer.layout().addWidget(listWidgetItem)
+		self._children.append(listWidgetItem)
 
 		return listWidgetItem
 
@@ -221,6 +324,8 @@ class ListWidget(QtWidgets.QWidget):
 			w = layout.takeAt(0)
 			w.widget().setParent(None)
 
+		self._children.clear()
+
 	def clearValue(self):
 		self._abandonChildren()
 
@@ -228,19 +333,36 @@ class ListWidget(QtWidgets.QWidget):
 		self.valueChanged.emit(self.value())
 
 	def value(self):
-		v = []
-		layout = self.childrenContainer.layout()
-		for idx in range(layout.count()):
-			widget = layout.itemAt(idx).widget()
-			v.append(widget.value())
-
-		return v
+		return [child.value() for child in self._children]
 
 	def setValue(self, values):
-		self._abandonChildren()
-		for v in values:
-			w = self._addKid(v)
-			w.setValue(v)
+		# bulk load: suspend repaints and child signal hookup so each item
+		# does not trigger a full value() rescan and valueChanged cascade
+		values = list(values)
+
+		self.setUpdatesEnabled(False)
+		self.blockSignals(True)
+		newKids = []
+		try:
+			# reuse existing item widgets in place; only grow/shrink the tail
+			reused = min(len(self._children), len(values))
+			for i in range(reused):
+				self._children[i].setValue(values[i])
+
+			while len(self._children) > len(values):
+				self._children[-1].abandon()
+
+			for v in values[reused:]:
+				kid = self._addKid(connectSignal=False)
+				kid.setValue(v)
+				newKids.append(kid)
+		finally:
+			for kid in newKids:
+				kid.valueChanged.connect(self.onChildValueChanged)
+			self.blockSignals(False)
+			self.setUpdatesEnabled(True)
+
+		self.valueChanged.emit(self.value())
 
 class FileChooser(QtWidgets.QWidget):
 	valueChanged = QtCore.Signal(pathlib.Path)
@@ -248,23 +370,24 @@ class FileChooser(QtWidgets.QWidget):
 	def __init__(self, parent=None):
 		super().__init__(parent)
 
-		self.setLayout(QtWidgets.QHBoxLayout())
-		self.layout().setSpacing(0)
-		self.layout().setContentsMargins(0, 0, 0, 0)
+		self._lay = _flatHBox(self)
 
 		self.textBox = QtWidgets.QLineEdit()
 		self.browseButton = QtWidgets.QToolButton()
-		self.browseButton.setText('…')
+		self.browseButton.setIcon(_glyphIcon('…'))
 
-		self.layout().addWidget(self.textBox)
-		self.layout().addWidget(self.browseButton)
+		self._lay.addWidget(self.textBox)
+		self._lay.addWidget(self.browseButton)
 
 		self.textBox.textChanged.connect(lambda text: self.valueChanged.emit(pathlib.Path(text)))
-		self.browseButton.clicked.connect(self._browse)
+		self.browseButton.clicked.connect(self._browse, QtCore.Qt.DirectConnection)
 
 		self.clear = self.textBox.clear
 		self.fileDialog = QtWidgets.QFileDialog()
 
+		self._cachedText = None
+		self._cachedPath = None
+
 	def _browse(self):
 		self.fileDialog.setDirectory(str(self.value().parent))
 		if not self.fileDialog.exec_():
@@ -278,7 +401,12 @@ class FileChooser(QtWidgets.QWidget):
 			self.valueChanged.emit(selectedFile)
 
 	def value(self):
-		return pathlib.Path(self.textBox.text())
+		text = self.textBox.text()
+		if text != self._cachedText:
+			self._cachedPath = pathlib.Path(text)
+			self._cachedText = text
+
+		return self._cachedPath
 
 	def setValue(self, val):
 		self.textBox.setText(str(val))
@@ -301,6 +429,16 @@ class ComboBox(QtWidgets.QComboBox):
 		for i,value in enumerate(values):
 			self.addItem(str(labels[i]), value)
 
+		# items start at index 2, after the blank row and separator
+		valueIndex = {None: 0}
+		for i,value in enumerate(values):
+			try:
+				valueIndex[value] = i + 2
+			except TypeError:
+				pass
+
+		self._valueIndex = valueIndex
+
 	def clearValue(self):
 		self.setValue(None)
 
@@ -308,31 +446,40 @@ class ComboBox(QtWidgets.QComboBox):
 		return self.currentData()
 
 	def setValue(self, val):
+		try:
+			index = self._valueIndex.get(val)
+		except TypeError:
+			index = None
+
+		if index is not None:
+			self.setCurrentIndex(index)
+			return
+
 		for i in range(self.count()):
 			if val == self.itemData(i):
 				self.setCurrentIndex(i)
 				break
 
-class SerialPortChooser(QtWidgets.QWidget):
-	portInfos = None
+# OS port enumeration is slow; share one recent scan across all choosers
+_PORTS_CACHE = {'ts': 0.0, 'data': None}
+_PORTS_CACHE_TTL = 2.0
 
+class SerialPortChooser(QtWidgets.QWidget):
 	def __init__(self, parent=None):
 		super().__init__(parent)
 
-		self.setLayout(QtWidgets.QHBoxLayout())
-		self.layout().setSpacing(0)
-		self.layout().setContentsMargins(0, 0, 0, 0)
+		self._lay = _flatHBox(self)
 
 		devices, labels = self.getPortsAndLabels()
 		self.combobox = ComboBox(devices, labels, parent=self)
 
 		self.refreshButton = QtWidgets.QToolButton(self)
-		self.refreshButton.setText('🔍')
+		self.refreshButton.setIcon(_glyphIcon('🔍'))
 		self.refreshButton.setToolTip('Refresh list')
-		self.refreshButton.clicked.connect(self.refreshPorts)
+		self.refreshButton.clicked.connect(self.refreshPorts, QtCore.Qt.DirectConnection)
 
-		self.layout().addWidget(self.combobox)
-		self.layout().addWidget(self.refreshButton)
+		self._lay.addWidget(self.combobox)
+		self._lay.addWidget(self.refreshButton)
 
 		self.clearValue = self.combobox.clearValue
 		self.valueChanged = self.combobox.valueChanged
@@ -342,13 +489,17 @@ class SerialPortChooser(QtWidgets.QWidget):
 		self.setFocus = self.combobox.setFocus
 
 	def getPortsAndLabels(self, reload=False):
+		now = time.monotonic()
+		portInfos = _PORTS_CACHE['data']
+		if reload or portInfos is None or now - _PORTS_CACHE['ts'] >= _PORTS_CACHE_TTL:
+			portInfos = list(serial.tools.list_ports.comports())
+			_PORTS_CACHE['data'] = portInfos
+			_PORTS_CACHE['ts'] = now
+
 		deviceList = []
 		nameList = []
 
-		if reload or SerialPortChooser.portInfos is None:
-			SerialPortChooser.portInfos = list(serial.tools.list_ports.comports())
-
-		for portInfo in SerialPortChooser.portInfos:
+		for portInfo in portInfos:
 			deviceList.append(portInfo.device)
 			name = portInfo.description
 			if portInfo.device not in name:
@@ -386,17 +537,11 @@ class SpinBox(QtWidgets.QSpinBox):
 	def __init__(self, minimum=None, maximum=None, parent=None):
 		super().__init__(parent)
 
-		minimum = minimum or SpinBox.minimum
-		if minimum is not None:
-			self.setMinimum(minimum)
-
-		maximum = maximum or SpinBox.maximum
-		if maximum is not None:
-			self.setMaximum(maximum)
+		self.setMinimum(SpinBox.minimum if minimum is None else minimum)
+		self.setMaximum(SpinBox.maximum if maximum is None else maximum)
 
 	def setValue(self, val):
 		if val is None:
-			self.setToNone = True
 			self.clear()
 		else:
 			super().setValue(val)
@@ -409,25 +554,26 @@ class DoubleSpinBox(QtWidgets.QDoubleSpinBox):
 	def __init__(self, decimals=None, minimum=None, maximum=None, parent=None):
 		super().__init__(parent)
 
-		decimals = decimals or DoubleSpinBox.decimals
-		if decimals is not None:
-			self.setDecimals(decimals)
-
-		minimum = minimum or DoubleSpinBox.minimum
-		if minimum is not None:
-			self.setMinimum(minimum)
-
-		maximum = maximum or DoubleSpinBox.maximum
-		if maximum is not None:
-			self.setMaximum(maximum)
+		self.setDecimals(DoubleSpinBox.decimals if decimals is None else decimals)
+		self.setMinimum(DoubleSpinBox.minimum if minimum is None else minimum)
+		self.setMaximum(DoubleSpinBox.maximum if maximum is None else maximum)
 
 	def setValue(self, val):
 		if val is None:
-			self.setToNone = True
 			self.clear()
 		else:
 			super().setValue(val)
 
+_sharedColorDialog = None
+
+def _getColorDialog():
+	''' Lazily creates a single QColorDialog shared by every ColorWidget '''
+	global _sharedColorDialog
+	if _sharedColorDialog is None:
+		_sharedColorDialog = QtWidgets.QColorDialog()
+
+	return _sharedColorDialog
+
 class ColorWidget(QtWidgets.QPushButton):
 	valueChanged = QtCore.Signal(tuple)
 
@@ -435,28 +581,38 @@ class ColorWidget(QtWidgets.QPushButton):
 		super().__init__(parent)
 
 		self.hasAlpha = hasAlpha
-		self.dialog = None
-		self.clicked.connect(self.onClick)
+		self._swatchSize = max(self.height(), 1)
+		self._updatePending = False
+		self._pendingValue = None
+		self.clicked.connect(self.onClick, QtCore.Qt.DirectConnection)
 
 		self.clearValue()
 
-	def onClick(self):
-		if self.dialog is None:
-			self.dialog = QtWidgets.QColorDialog()
-			self.dialog.setCurrentColor(QtGui.QColor(*self.colorValue))
-			self.dialog.currentColorChanged.connect(self.onColorAdjusted)
+	def resizeEvent(self, event):
+		super().resizeEvent(event)
+
+		side = max(self.height(), 1)
+		if side != self._swatchSize:
+			self._swatchSize = side
+			self.setIcon(_swatchIcon(side, self.colorValue))
 
-		self.dialog.setOption(self.dialog.ColorDialogOption.ShowAlphaChannel, self.hasAlpha)
+	def onClick(self):
+		dialog = _getColorDialog()
+		dialog.setOption(dialog.ColorDialogOption.ShowAlphaChannel, self.hasAlpha)
+		dialog.setCurrentColor(QtGui.QColor(*self.colorValue))
+		dialog.currentColorChanged.connect(self.onColorAdjusted)
 
 		preservedValue = self.colorValue
-		self.dialog.exec_()
+		try:
+			dialog.exec_()
+		finally:
+			dialog.currentColorChanged.disconnect(self.onColorAdjusted)
 
-		if self.dialog.result() != QtWidgets.QDialog.Accepted:
+		if dialog.result() != QtWidgets.QDialog.Accepted:
 			self.setValue(preservedValue)
 			self.valueChanged.emit(preservedValue)
 
-	def toTuple(self):
-		color = self.dialog.currentColor()
+	def toTuple(self, color):
 		value = [color.red(), color.green(), color.blue()]
 		if self.hasAlpha:
 			value.append(color.alpha())
@@ -476,9 +632,7 @@ class ColorWidget(QtWidgets.QPushButton):
 		self.colorValue = tuple(val)
 		self.setText(' %s' % (self.colorValue,))
 
-		pixmap = QtGui.QPixmap(self.height(), self.height())
-		pixmap.fill(QtGui.QColor(*val))
-		self.setIcon(QtGui.QIcon(pixmap))
+		self.setIcon(_swatchIcon(self._swatchSize, self.colorValue))
 
 	def clearValue(self):
 		if self.hasAlpha:
@@ -487,6 +641,37 @@ class ColorWidget(QtWidgets.QPushButton):
 			self.setValue((0, 0, 0))
 
 	def onColorAdjusted(self, color):
-		value = self.toTuple()
+		# coalesce rapid color-dialog notifications into one update per event-loop tick
+		self._pendingValue = self.toTuple(color)
+		if not self._updatePending:
+			self._updatePending = True
+			QtCore.QTimer.singleShot(0, self._flushPendingValue)
+
+	def _flushPendingValue(self):
+		self._updatePending = False
+		value = self._pendingValue
 		self.setValue(value)
 		self.valueChanged.emit(value)
+
+# ResetableWidget dispatch tables: which attribute carries each widget's change
+# signal, and which method stands in for a missing clearValue. Keyed by exact
+# type so lookup replaces a chain of hasattr probes; unknown subclasses still
+# take the probing path in _aliasWidgetApi.
+_SIGNAL_ATTR = {
+	SpinBox: 'valueChanged',
+	DoubleSpinBox: 'valueChanged',
+	LineEdit: 'textChanged',
+	ComboBox: 'valueChanged',
+	BoolSelector: 'valueChanged',
+	FileChooser: 'valueChanged',
+	SerialPortChooser: 'valueChanged',
+	ListWidget: 'valueChanged',
+	ColorWidget: 'valueChanged',
+}
+
+_CLEAR_ALIAS = {
+	SpinBox: 'clear',
+	DoubleSpinBox: 'clear',
+	LineEdit: 'clear',
+	FileChooser: 'clear',
+}